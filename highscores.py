@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 from dataclasses import dataclass
 from typing import List
 
@@ -12,12 +13,12 @@ class HighScoreEntry:
     score: int
 
 
+# Single-pass cleanup: strip C0 control chars and DEL in one compiled regex.
+_CTRL_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+
 def _sanitize_name(name: str) -> str:
-    name = (name or "").strip()
-    if not name:
-        return "PLAYER"
-    name = "".join(ch for ch in name if ch.isprintable())
-    name = name.replace("\n", " ").replace("\r", " ").replace("\t", " ")
+    name = _CTRL_RE.sub("", (name or "").strip())
     return name[:16].strip() or "PLAYER"
 
 
@@ -34,8 +35,30 @@ def _default_path() -> str:
     return os.path.join(here, "highscores.json")
 
 
+# Parsed-file cache keyed by path; the UI polls load_highscores() every
+# frame, so we only re-read and re-parse when the file's mtime changes.
+_CACHE: dict[str, tuple[float, List[HighScoreEntry]]] = {}
+
+# Anything bigger than this is not a plausible highscore file; refuse to
+# parse it rather than stall the UI (or worse) on corrupt/hostile input.
+_MAX_FILE_SIZE = 1 << 20  # 1 MiB
+
+
 def load_highscores(path: str | None = None) -> List[HighScoreEntry]:
     path = path or _default_path()
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    mtime = st.st_mtime
+
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+
+    if st.st_size > _MAX_FILE_SIZE:
+        return []
+
     try:
         with open(path, "r", encoding="utf-8") as f:
             payload = json.load(f)
@@ -53,6 +76,7 @@ def load_highscores(path: str | None = None) -> List[HighScoreEntry]:
         score = max(0, _safe_int(it.get("score", 0)))
         out.append(HighScoreEntry(name=name, score=score))
     out.sort(key=lambda e: e.score, reverse=True)
+    _CACHE[path] = (mtime, list(out))
     return out
 
 
@@ -65,8 +89,15 @@ def save_highscore(name: str, score: int, path: str | None = None, keep_max: int
 
     payload = {"scores": [{"name": e.name, "score": e.score} for e in entries]}
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        # Serialize to memory first so the file sees a single write, then
+        # swap into place atomically so a crash can't leave a torn file.
+        data = json.dumps(payload, indent=2).encode("utf-8")
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        # We already hold the parsed list; refresh the cache without a re-read.
+        _CACHE[path] = (os.path.getmtime(path), list(entries))
     except Exception:
         # If saving fails, just return the in-memory list.
         pass
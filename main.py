@@ -4,9 +4,11 @@ import math
 import os
 import random
 import sys
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Iterable, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from highscores import HighScoreEntry, load_highscores, save_highscore
@@ -27,8 +29,10 @@ WIN_W = GRID_W * CELL
 WIN_H = GRID_H * CELL + HUD_H
 
 FPS = 120
+RENDER_HZ = 60  # input/update tick at FPS; full-screen redraws are capped here
 MOVE_HZ_START = 8.5
 MOVE_HZ_MAX = 18.0
+MOVE_CATCHUP_MAX = 5  # max snake steps per frame; drop the rest after a stall
 
 SCORE_PER_FOOD = 10
 
@@ -68,27 +72,28 @@ def rect_for_cell(x: int, y: int) -> pygame.Rect:
     return pygame.Rect(px, py, CELL, CELL)
 
 
-def rand_empty_cell(occupied: set[Tuple[int, int]]) -> Tuple[int, int]:
-    # Guaranteed to find a spot unless grid is full.
-    attempts = 0
-    while True:
-        x = random.randrange(0, GRID_W)
-        y = random.randrange(0, GRID_H)
-        if (x, y) not in occupied:
-            return x, y
-        attempts += 1
-        if attempts > 10_000:
-            # Fallback: scan (should never happen in normal gameplay)
-            for yy in range(GRID_H):
-                for xx in range(GRID_W):
-                    if (xx, yy) not in occupied:
-                        return xx, yy
-
-
 def draw_rounded_rect(surf: pygame.Surface, rect: pygame.Rect, color, radius: int) -> None:
     pygame.draw.rect(surf, color, rect, border_radius=radius)
 
 
+# Rendered-text memo: most strings repeat frame after frame (titles, tips,
+# score lines), so cache the FreeType output. FIFO-capped so one-off strings
+# (e.g. name entry) can't grow it without bound.
+_TEXT_CACHE: dict = {}
+_TEXT_CACHE_MAX = 256
+
+
+def _render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (id(font), text, color)
+    img = _TEXT_CACHE.get(key)
+    if img is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))
+        img = font.render(text, True, color)
+        _TEXT_CACHE[key] = img
+    return img
+
+
 def draw_text(
     surf: pygame.Surface,
     font: pygame.font.Font,
@@ -98,7 +103,7 @@ def draw_text(
     *,
     align: str = "topleft",
 ) -> pygame.Rect:
-    img = font.render(text, True, color)
+    img = _render_text(font, text, color)
     r = img.get_rect()
     # pygame.Rect supports a fixed set of anchor attribute names.
     # We allow a few friendly aliases to avoid runtime crashes.
@@ -123,34 +128,73 @@ def draw_text(
 # -----------------------------
 
 
+# Direction vectors as shared module constants; the opposite table makes the
+# reversal check a single dict lookup, and DIRS maps keys straight to vectors
+# instead of a five-way if/elif chain in the event loop.
+DIR_UP = (0, -1)
+DIR_DOWN = (0, 1)
+DIR_LEFT = (-1, 0)
+DIR_RIGHT = (1, 0)
+
+OPPOSITE = {DIR_UP: DIR_DOWN, DIR_DOWN: DIR_UP, DIR_LEFT: DIR_RIGHT, DIR_RIGHT: DIR_LEFT}
+
+DIRS = {
+    pygame.K_UP: DIR_UP,
+    pygame.K_w: DIR_UP,
+    pygame.K_DOWN: DIR_DOWN,
+    pygame.K_s: DIR_DOWN,
+    pygame.K_LEFT: DIR_LEFT,
+    pygame.K_a: DIR_LEFT,
+    pygame.K_RIGHT: DIR_RIGHT,
+    pygame.K_d: DIR_RIGHT,
+}
+
+
 @dataclass
 class Snake:
-    body: List[Tuple[int, int]]  # head at index 0
+    body: deque[Tuple[int, int]]  # head at index 0; deque for O(1) ends
     dir: Tuple[int, int]
     pending_dir: Optional[Tuple[int, int]] = None
+    # Mirrors `body` for O(1) membership tests; kept in sync by step().
+    body_set: set[Tuple[int, int]] = field(default_factory=set)
+    # NumPy mirror of `body` for vectorized interpolation; rebuilt once per
+    # move tick (cheap), read every render frame.
+    body_arr: np.ndarray = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        self.body = deque(self.body)  # accept any iterable from callers
+        self.body_set = set(self.body)
+        self.body_arr = np.asarray(self.body, dtype=np.int16)
 
     def occupied(self) -> set[Tuple[int, int]]:
-        return set(self.body)
+        return self.body_set
 
     def head(self) -> Tuple[int, int]:
         return self.body[0]
 
     def set_dir(self, new_dir: Tuple[int, int]) -> None:
         # Prevent reversing into itself.
-        if (-new_dir[0], -new_dir[1]) == self.dir:
+        if OPPOSITE[new_dir] == self.dir:
             return
         self.pending_dir = new_dir
 
-    def step(self, grow: bool) -> None:
+    def step(self, grow: bool) -> Optional[Tuple[int, int]]:
+        """Advance one cell; returns the vacated tail cell, if any."""
         if self.pending_dir is not None:
             self.dir = self.pending_dir
             self.pending_dir = None
         hx, hy = self.head()
         dx, dy = self.dir
         nx, ny = hx + dx, hy + dy
-        self.body.insert(0, (nx, ny))
+        tail: Optional[Tuple[int, int]] = None
         if not grow:
-            self.body.pop()
+            # Remove the tail first so stepping into its cell stays legal.
+            tail = self.body.pop()
+            self.body_set.discard(tail)
+        self.body.appendleft((nx, ny))
+        self.body_set.add((nx, ny))
+        self.body_arr = np.asarray(self.body, dtype=np.int16)
+        return tail
 
 
 class Scene:
@@ -168,32 +212,72 @@ class Game:
     score: int
     paused: bool
 
-    # Timing
+    # Timing. Integer milliseconds: no float drift over long sessions, and
+    # the step threshold is recomputed only when move_hz changes.
     move_hz: float
-    move_accum: float
-    # For interpolation between steps
-    last_body: List[Tuple[int, int]]
+    move_accum_ms: int
+    move_interval_ms: int = field(init=False, default=0)
+    # For interpolation between steps (NumPy snapshot of the previous body)
+    last_body: np.ndarray
 
     # Game-over name entry
     name: str
     saved: bool
 
+    # Free-cell bookkeeping for O(1) food spawns: `free_list` holds every
+    # cell the snake doesn't occupy, `free_idx` maps cell -> position in
+    # the list so removal is a swap-with-last instead of a scan.
+    free_list: List[Tuple[int, int]] = field(init=False, default_factory=list)
+    free_idx: dict = field(init=False, default_factory=dict)
+
     def reset(self) -> None:
         start_x = GRID_W // 2
         start_y = GRID_H // 2
-        self.snake = Snake(body=[(start_x, start_y), (start_x - 1, start_y)], dir=(1, 0))
+        self.snake = Snake(body=[(start_x, start_y), (start_x - 1, start_y)], dir=DIR_RIGHT)
         self.score = 0
         self.paused = False
-        self.move_hz = MOVE_HZ_START
-        self.move_accum = 0.0
-        self.last_body = list(self.snake.body)
+        self.set_move_hz(MOVE_HZ_START)
+        self.move_accum_ms = 0
+        self.last_body = self.snake.body_arr
         self.name = ""
         self.saved = False
+        occ = self.snake.occupied()
+        self.free_list = [(x, y) for y in range(GRID_H) for x in range(GRID_W) if (x, y) not in occ]
+        self.free_idx = {cell: i for i, cell in enumerate(self.free_list)}
         self.spawn_food()
 
+    def set_move_hz(self, hz: float) -> None:
+        self.move_hz = clamp(hz, MOVE_HZ_START, MOVE_HZ_MAX)
+        self.move_interval_ms = int(1000 / self.move_hz)
+
+    def _free_remove(self, cell: Tuple[int, int]) -> None:
+        i = self.free_idx.pop(cell, None)
+        if i is None:
+            return
+        last = self.free_list.pop()
+        if last != cell:
+            self.free_list[i] = last
+            self.free_idx[last] = i
+
+    def _free_add(self, cell: Tuple[int, int]) -> None:
+        if cell in self.free_idx:
+            return
+        self.free_idx[cell] = len(self.free_list)
+        self.free_list.append(cell)
+
+    def on_step(self, popped_tail: Optional[Tuple[int, int]]) -> None:
+        # Keep free-cell bookkeeping in sync after Snake.step(). Free the
+        # vacated tail before claiming the head cell: when the head chases
+        # the tail into the same cell, the reverse order would leave an
+        # occupied cell marked free.
+        if popped_tail is not None:
+            self._free_add(popped_tail)
+        self._free_remove(self.snake.head())
+
     def spawn_food(self) -> None:
-        occ = self.snake.occupied()
-        self.food = rand_empty_cell(occ)
+        if not self.free_list:
+            return  # Board is full; nothing left to spawn.
+        self.food = random.choice(self.free_list)
 
 
 # -----------------------------
@@ -204,58 +288,170 @@ class Game:
 def make_background(size: Tuple[int, int]) -> pygame.Surface:
     w, h = size
     bg = pygame.Surface((w, h)).convert()
-    top = (13, 18, 38)
-    bot = (24, 10, 38)
-    for y in range(h):
-        t = y / max(1, h - 1)
-        c = lerp_color(top, bot, t)
-        pygame.draw.line(bg, c, (0, y), (w, y))
+    top = np.array((13, 18, 38), dtype=np.float32)
+    bot = np.array((24, 10, 38), dtype=np.float32)
+    # Vectorized vertical gradient: one (h, 3) lerp, broadcast across columns.
+    ys = np.linspace(0.0, 1.0, h, dtype=np.float32)[:, None]
+    grad = (top * (1.0 - ys) + bot * ys).astype(np.uint8)
+    pixels = np.broadcast_to(grad[None, :, :], (w, h, 3))
+    pygame.surfarray.blit_array(bg, pixels)
     return bg
 
 
-def draw_grid(surf: pygame.Surface, tsec: float) -> None:
-    # Subtle animated grid glow
-    base = (255, 255, 255)
-    alpha = int(22 + 10 * math.sin(tsec * 1.2))
-    col = add_alpha(base, alpha)
+# Pre-rendered grid lines; built once in main() so the per-frame cost is a
+# single alpha-modulated blit instead of ~57 line draws.
+_grid_surf: Optional[pygame.Surface] = None
+
+
+def _build_grid_surface() -> pygame.Surface:
+    global _grid_surf
     grid = pygame.Surface((WIN_W, WIN_H - HUD_H), pygame.SRCALPHA)
+    col = (255, 255, 255)
     for x in range(0, WIN_W + 1, CELL):
         pygame.draw.line(grid, col, (x, 0), (x, WIN_H - HUD_H))
     for y in range(0, WIN_H - HUD_H + 1, CELL):
         pygame.draw.line(grid, col, (0, y), (WIN_W, y))
+    # Match the display pixel format so blits skip per-pixel conversion.
+    grid = grid.convert_alpha()
+    _grid_surf = grid
+    return grid
+
+
+def draw_grid(surf: pygame.Surface, tsec: float) -> None:
+    # Subtle animated grid glow: modulate the cached surface's alpha only.
+    grid = _grid_surf if _grid_surf is not None else _build_grid_surface()
+    grid.set_alpha(int(22 + 10 * math.sin(tsec * 1.2)))
     surf.blit(grid, (0, HUD_H))
 
 
+# HUD caches: the panel/title/controls only change with the slow accent
+# cycle, and the stats line only changes when the score or speed does, so
+# neither needs FreeType work every frame.
+_HUD_ACCENT_STEPS = 24
+_hud_static: Optional[pygame.Surface] = None
+_hud_static_key: int = -1
+_hud_stats_cache: dict = {}
+_HUD_STATS_CACHE_MAX = 32
+
+
+def _hud_static_surface(
+    font_big: pygame.font.Font, font_small: pygame.font.Font, accent_idx: int
+) -> pygame.Surface:
+    global _hud_static, _hud_static_key
+    if _hud_static is None or _hud_static_key != accent_idx:
+        hud = pygame.Surface((WIN_W, HUD_H), pygame.SRCALPHA)
+        # Glassy HUD panel
+        panel = pygame.Rect(16, 16, WIN_W - 32, HUD_H - 24)
+        draw_rounded_rect(hud, panel, add_alpha((10, 12, 26), 200), 18)
+        pygame.draw.rect(hud, add_alpha((255, 255, 255), 34), panel, width=2, border_radius=18)
+
+        accent = lerp_color((255, 78, 205), (0, 232, 255), (accent_idx + 0.5) / _HUD_ACCENT_STEPS)
+        # Less cramped layout: title left, paused right, stats on one line,
+        # controls split across two lines.
+        draw_text(hud, font_big, "SNAKE VIBES", (32, 26), accent, align="topleft")
+        draw_text(hud, font_small, "Move: Arrows/WASD   Pause: P   Restart: R", (WIN_W - 32, 52), (170, 180, 210), align="topright")
+        draw_text(hud, font_small, "High Scores: H   Quit: Esc", (WIN_W - 32, 72), (170, 180, 210), align="topright")
+
+        _hud_static = hud.convert_alpha()
+        _hud_static_key = accent_idx
+    return _hud_static
+
+
 def draw_hud(
     surf: pygame.Surface,
     font_big: pygame.font.Font,
     font: pygame.font.Font,
+    font_small: pygame.font.Font,
     score: int,
     move_hz: float,
     paused: bool,
     tsec: float,
 ) -> None:
-    hud = pygame.Surface((WIN_W, HUD_H), pygame.SRCALPHA)
-    # Glassy HUD panel
-    panel = pygame.Rect(16, 16, WIN_W - 32, HUD_H - 24)
-    draw_rounded_rect(hud, panel, add_alpha((10, 12, 26), 200), 18)
-    pygame.draw.rect(hud, add_alpha((255, 255, 255), 34), panel, width=2, border_radius=18)
-
-    accent = lerp_color((255, 78, 205), (0, 232, 255), 0.5 + 0.5 * math.sin(tsec * 0.9))
-    # Less cramped layout: title left, paused right, stats on one line,
-    # controls split across two lines.
-    font_small = pygame.font.Font(None, 22)
+    accent_t = 0.5 + 0.5 * math.sin(tsec * 0.9)
+    accent_idx = min(_HUD_ACCENT_STEPS - 1, int(accent_t * _HUD_ACCENT_STEPS))
+    surf.blit(_hud_static_surface(font_big, font_small, accent_idx), (0, 0))
 
-    draw_text(hud, font_big, "SNAKE VIBES", (32, 26), accent, align="topleft")
     if paused:
-        draw_text(hud, font_big, "PAUSED", (WIN_W - 32, 26), (255, 220, 120), align="topright")
+        draw_text(surf, font_big, "PAUSED", (WIN_W - 32, 26), (255, 220, 120), align="topright")
+
+    key = (score, round(move_hz, 1))
+    img = _hud_stats_cache.get(key)
+    if img is None:
+        if len(_hud_stats_cache) >= _HUD_STATS_CACHE_MAX:
+            _hud_stats_cache.pop(next(iter(_hud_stats_cache)))
+        stats = f"Score: {score}    Speed: {move_hz:.1f} Hz"
+        img = font.render(stats, True, (236, 240, 255))
+        _hud_stats_cache[key] = img
+    surf.blit(img, (32, 58))
+
+
+# Glow sprite caches: rasterizing concentric alpha circles per frame is the
+# hot path, so we pre-bake sprites keyed by quantized color/phase and blit the
+# nearest match instead. Quantization steps are coarse enough for high hit
+# rates but fine enough to be visually indistinguishable.
+_FOOD_GLOW_STEPS = 16
+_SNAKE_COLOR_STEP = 16  # quantize each RGB channel to 16 levels
+_SNAKE_T_STEPS = 8
+
+_food_glow_cache: dict = {}
+_snake_glow_cache: dict = {}
+
+
+def _food_glow_sprite(pi: int) -> pygame.Surface:
+    sprite = _food_glow_cache.get(pi)
+    if sprite is None:
+        p = (pi + 0.5) / _FOOD_GLOW_STEPS
+        glow = int(90 + 70 * p)
+        c = lerp_color((255, 183, 0), (255, 60, 200), p)
+        # Rasterize at half resolution (quarter the pixels for the soft
+        # circles) and smoothscale up once here at build time.
+        half = CELL * 3 // 2
+        sprite = pygame.Surface((half, half), pygame.SRCALPHA)
+        center = (half / 2, half / 2)
+        for i in range(7, 0, -1):
+            rr = int(((CELL * 0.6) + i * 2) / 2)
+            aa = int(glow * (i / 7) * 0.20)
+            pygame.draw.circle(sprite, add_alpha(c, aa), center, rr)
+        sprite = pygame.transform.smoothscale(sprite, (CELL * 3, CELL * 3)).convert_alpha()
+        _food_glow_cache[pi] = sprite
+    return sprite
+
+
+def _snake_glow_sprite(col: Tuple[int, int, int], ti: int) -> pygame.Surface:
+    qcol = (col[0] // _SNAKE_COLOR_STEP, col[1] // _SNAKE_COLOR_STEP, col[2] // _SNAKE_COLOR_STEP)
+    key = (qcol, ti)
+    sprite = _snake_glow_cache.get(key)
+    if sprite is None:
+        t = (ti + 0.5) / _SNAKE_T_STEPS
+        rep = (
+            qcol[0] * _SNAKE_COLOR_STEP + _SNAKE_COLOR_STEP // 2,
+            qcol[1] * _SNAKE_COLOR_STEP + _SNAKE_COLOR_STEP // 2,
+            qcol[2] * _SNAKE_COLOR_STEP + _SNAKE_COLOR_STEP // 2,
+        )
+        # Half-resolution bake + one smoothscale, as for the food glow.
+        sprite = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+        center = (CELL / 2, CELL / 2)
+        for k in range(6, 0, -1):
+            rr = int((CELL * 0.45 + k * 2) / 2)
+            aa = int(50 * (k / 6) * (1.0 - 0.7 * t))
+            pygame.draw.circle(sprite, add_alpha(rep, aa), center, rr)
+        sprite = pygame.transform.smoothscale(sprite, (CELL * 2, CELL * 2)).convert_alpha()
+        _snake_glow_cache[key] = sprite
+    return sprite
 
-    stats = f"Score: {score}    Speed: {move_hz:.1f} Hz"
-    draw_text(hud, font, stats, (32, 58), (236, 240, 255), align="topleft")
 
-    draw_text(hud, font_small, "Move: Arrows/WASD   Pause: P   Restart: R", (WIN_W - 32, 52), (170, 180, 210), align="topright")
-    draw_text(hud, font_small, "High Scores: H   Quit: Esc", (WIN_W - 32, 72), (170, 180, 210), align="topright")
-    surf.blit(hud, (0, 0))
+# Full-screen dim layer for GAME_OVER; built lazily once instead of
+# allocating and filling a fresh ~1.6 MB surface every frame.
+_dim_overlay: Optional[pygame.Surface] = None
+
+
+def _dim_overlay_surface() -> pygame.Surface:
+    global _dim_overlay
+    if _dim_overlay is None:
+        s = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
+        s.fill(add_alpha((8, 8, 14), 160))
+        _dim_overlay = s.convert_alpha()
+    return _dim_overlay
 
 
 def draw_food(surf: pygame.Surface, food: Tuple[int, int], tsec: float) -> None:
@@ -264,33 +460,41 @@ def draw_food(surf: pygame.Surface, food: Tuple[int, int], tsec: float) -> None:
 
     # Pulse
     p = 0.5 + 0.5 * math.sin(tsec * 6.0)
-    glow = int(90 + 70 * p)
+    pi = min(_FOOD_GLOW_STEPS - 1, int(p * _FOOD_GLOW_STEPS))
+    surf.blit(_food_glow_sprite(pi), (r.centerx - CELL * 1.5, r.centery - CELL * 1.5))
+
+    c = lerp_color((255, 183, 0), (255, 60, 200), p)
+    draw_rounded_rect(surf, r.inflate(-6, -6), add_alpha(c, 255), 10)
 
-    base = (255, 183, 0)
-    hot = (255, 60, 200)
-    c = lerp_color(base, hot, p)
 
-    gsurf = pygame.Surface((CELL * 3, CELL * 3), pygame.SRCALPHA)
-    center = (CELL * 1.5, CELL * 1.5)
-    for i in range(7, 0, -1):
-        rr = int((CELL * 0.6) + i * 2)
-        aa = int(glow * (i / 7) * 0.20)
-        pygame.draw.circle(gsurf, add_alpha(c, aa), center, rr)
-    surf.blit(gsurf, (r.centerx - CELL * 1.5, r.centery - CELL * 1.5))
+def _snake_body_colors(n: int, tsec: float) -> list:
+    """Per-segment body colors as one vectorized computation.
 
-    draw_rounded_rect(surf, r.inflate(-6, -6), add_alpha(c, 255), 10)
+    Equivalent to the old per-segment lerp_color chain
+    (mid -> c3 by shimmer, then -> c2 by t) but evaluated for the
+    whole body in a handful of NumPy ops instead of ~3 tuple lerps
+    and a sin() per segment.
+    """
+    c2 = np.array((255, 70, 220), dtype=np.float32)
+    c3 = np.array((140, 255, 120), dtype=np.float32)
+    mid = np.array(lerp_color((0, 240, 255), (255, 70, 220), 0.6), dtype=np.float32)
+
+    ts = np.arange(n, dtype=np.float32) / max(1, n - 1)
+    shimmer = (0.35 + 0.35 * np.sin(tsec * 1.5 + ts * 2.0))[:, None]
+    cols = mid + (c3 - mid) * shimmer
+    cols += (c2 - cols) * ts[:, None]
+    return np.clip(cols, 0, 255).astype(np.uint8).tolist()
 
 
 def draw_snake(
     surf: pygame.Surface,
-    body_interp: List[Tuple[float, float]],
+    body_interp: np.ndarray,
     dir_vec: Tuple[int, int],
     tsec: float,
 ) -> None:
-    # Neon gradient along body
-    c1 = (0, 240, 255)
-    c2 = (255, 70, 220)
-    c3 = (140, 255, 120)
+    # Neon gradient along body, computed for all segments up front.
+    n = len(body_interp)
+    colors = _snake_body_colors(n, tsec)
 
     # Glow surface
     glow_s = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
@@ -300,22 +504,15 @@ def draw_snake(
         py = HUD_H + gy * CELL
         rect = pygame.Rect(px, py, CELL, CELL)
 
-        t = i / max(1, len(body_interp) - 1)
-        mid = lerp_color(c1, c2, 0.6)
-        col = lerp_color(mid, c3, 0.35 + 0.35 * math.sin(tsec * 1.5 + t * 2.0))
-        col = lerp_color(col, c2, t)
+        t = i / max(1, n - 1)
+        col = tuple(colors[i])
 
         # Slightly shrink segments for a modern look
         inner = rect.inflate(-6, -6)
 
-        # Glow per segment
-        g = pygame.Surface((CELL * 2, CELL * 2), pygame.SRCALPHA)
-        center = (CELL, CELL)
-        for k in range(6, 0, -1):
-            rr = int(CELL * 0.45 + k * 2)
-            aa = int(50 * (k / 6) * (1.0 - 0.7 * t))
-            pygame.draw.circle(g, add_alpha(col, aa), center, rr)
-        glow_s.blit(g, (rect.centerx - CELL, rect.centery - CELL))
+        # Glow per segment: pre-baked sprite lookup instead of 6 circle draws.
+        ti = min(_SNAKE_T_STEPS - 1, int(t * _SNAKE_T_STEPS))
+        glow_s.blit(_snake_glow_sprite(col, ti), (rect.centerx - CELL, rect.centery - CELL))
 
         draw_rounded_rect(surf, inner, add_alpha(col, 255), 10)
 
@@ -335,21 +532,16 @@ def draw_snake(
     surf.blit(glow_s, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
 
 
-def interpolate_body(prev: List[Tuple[int, int]], cur: List[Tuple[int, int]], alpha: float) -> List[Tuple[float, float]]:
-    # Interpolate by index; if lengths differ, fall back for missing.
-    out: List[Tuple[float, float]] = []
-    n = max(len(prev), len(cur))
-    for i in range(n):
-        if i < len(prev):
-            px, py = prev[i]
-        else:
-            px, py = prev[-1]
-        if i < len(cur):
-            cx, cy = cur[i]
-        else:
-            cx, cy = cur[-1]
-        out.append((lerp(px, cx, alpha), lerp(py, cy, alpha)))
-    return out
+def interpolate_body(prev: np.ndarray, cur: np.ndarray, alpha: float) -> np.ndarray:
+    # Interpolate by index as one vectorized lerp; if lengths differ
+    # (the snake just grew), pad the shorter array with its last row.
+    prev = np.asarray(prev, dtype=np.int16)
+    cur = np.asarray(cur, dtype=np.int16)
+    if len(prev) < len(cur):
+        prev = np.vstack([prev, np.repeat(prev[-1:], len(cur) - len(prev), axis=0)])
+    elif len(cur) < len(prev):
+        cur = np.vstack([cur, np.repeat(cur[-1:], len(prev) - len(cur), axis=0)])
+    return prev + (cur - prev) * alpha
 
 
 # -----------------------------
@@ -360,6 +552,10 @@ def interpolate_body(prev: List[Tuple[int, int]], cur: List[Tuple[int, int]], al
 def main() -> int:
     os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
     pygame.init()
+    # We only consume quit and keyboard events; blocking the rest (mouse
+    # motion etc.) keeps the SDL event queue small and cheap to drain.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
     pygame.display.set_caption(APP_TITLE)
     screen = pygame.display.set_mode((WIN_W, WIN_H))
     clock = pygame.time.Clock()
@@ -367,18 +563,20 @@ def main() -> int:
     font_big = pygame.font.Font(None, 44)
     font = pygame.font.Font(None, 26)
     font_mono = pygame.font.Font(None, 28)
+    font_small = pygame.font.Font(None, 22)
 
     bg = make_background((WIN_W, WIN_H))
+    _build_grid_surface()
 
     g = Game(
         scene=Scene.START,
-        snake=Snake(body=[(0, 0)], dir=(1, 0)),
+        snake=Snake(body=[(0, 0)], dir=DIR_RIGHT),
         food=(0, 0),
         score=0,
         paused=False,
         move_hz=MOVE_HZ_START,
-        move_accum=0.0,
-        last_body=[],
+        move_accum_ms=0,
+        last_body=np.empty((0, 2), dtype=np.int16),
         name="",
         saved=False,
     )
@@ -405,11 +603,15 @@ def main() -> int:
     go_start()
 
     running = True
+    render_accum = 0.0
     while running:
-        dt = clock.tick(FPS) / 1000.0
+        dt_ms = clock.tick(FPS)
+        dt = dt_ms / 1000.0
         tsec = pygame.time.get_ticks() / 1000.0
 
-        # Input
+        # Input. Direction keys are collapsed to the last one pressed this
+        # frame so held-key spam can't queue several turns in one tick.
+        latest_dir: Optional[Tuple[int, int]] = None
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 running = False
@@ -431,14 +633,8 @@ def main() -> int:
                         go_start()
 
                 elif g.scene == Scene.PLAY:
-                    if ev.key in (pygame.K_UP, pygame.K_w):
-                        g.snake.set_dir((0, -1))
-                    elif ev.key in (pygame.K_DOWN, pygame.K_s):
-                        g.snake.set_dir((0, 1))
-                    elif ev.key in (pygame.K_LEFT, pygame.K_a):
-                        g.snake.set_dir((-1, 0))
-                    elif ev.key in (pygame.K_RIGHT, pygame.K_d):
-                        g.snake.set_dir((1, 0))
+                    if ev.key in DIRS:
+                        latest_dir = DIRS[ev.key]
                     elif ev.key == pygame.K_p:
                         g.paused = not g.paused
                     elif ev.key == pygame.K_r:
@@ -468,14 +664,25 @@ def main() -> int:
                                 if len(g.name) < 16:
                                     g.name += ch
 
+        if latest_dir is not None and g.scene == Scene.PLAY:
+            g.snake.set_dir(latest_dir)
+
         # Update (gameplay)
         if g.scene == Scene.PLAY and not g.paused:
-            g.move_accum += dt * g.move_hz
-            while g.move_accum >= 1.0:
-                g.move_accum -= 1.0
+            g.move_accum_ms += dt_ms
+            steps = 0
+            while g.move_accum_ms >= g.move_interval_ms:
+                if steps >= MOVE_CATCHUP_MAX:
+                    # Long stall (window drag, hibernate): drop the backlog
+                    # instead of spiraling through hundreds of catch-up steps.
+                    g.move_accum_ms = 0
+                    break
+                g.move_accum_ms -= g.move_interval_ms
+                steps += 1
 
-                # Snapshot for interpolation
-                g.last_body = list(g.snake.body)
+                # Snapshot for interpolation (step() rebuilds body_arr, so
+                # this reference stays frozen at the pre-step state)
+                g.last_body = g.snake.body_arr
 
                 # Determine if we grow this step.
                 # IMPORTANT: use the *effective* direction (pending_dir takes effect on this step).
@@ -483,32 +690,40 @@ def main() -> int:
                 nx, ny = g.snake.head()[0] + eff_dir[0], g.snake.head()[1] + eff_dir[1]
                 will_eat = (nx, ny) == g.food
 
-                g.snake.step(grow=will_eat)
-
-                hx, hy = g.snake.head()
-
                 # Wall collision -> game over (keeps gameplay crisp)
-                if hx < 0 or hx >= GRID_W or hy < 0 or hy >= GRID_H:
+                if nx < 0 or nx >= GRID_W or ny < 0 or ny >= GRID_H:
                     go_game_over()
                     break
 
-                # Self collision -> game over
-                if (hx, hy) in g.snake.body[1:]:
+                # Self collision -> game over. O(1) via body_set; the tail
+                # cell is legal to enter because it vacates this step
+                # (unless we grow and it stays put).
+                if (nx, ny) in g.snake.body_set and (will_eat or (nx, ny) != g.snake.body[-1]):
                     go_game_over()
                     break
 
+                popped_tail = g.snake.step(grow=will_eat)
+                g.on_step(popped_tail)
+
                 if will_eat:
                     g.score += SCORE_PER_FOOD
                     # Slight speed-up for "modern" pacing
-                    g.move_hz = clamp(g.move_hz + 0.25, MOVE_HZ_START, MOVE_HZ_MAX)
+                    g.set_move_hz(g.move_hz + 0.25)
                     g.spawn_food()
 
-        # Render
+        # Render. The window keeps showing the previous frame on skipped
+        # iterations, so halving the redraw rate halves blit/flip bandwidth
+        # without touching input latency or movement timing.
+        render_accum += dt * RENDER_HZ
+        if render_accum < 1.0 and running:
+            continue
+        render_accum = min(render_accum - 1.0, 1.0)
+
         screen.blit(bg, (0, 0))
         draw_grid(screen, tsec)
 
         if g.scene == Scene.START:
-            draw_hud(screen, font_big, font, 0, MOVE_HZ_START, False, tsec)
+            draw_hud(screen, font_big, font, font_small, 0, MOVE_HZ_START, False, tsec)
             center = (WIN_W // 2, WIN_H // 2 + 30)
 
             accent = lerp_color((255, 78, 205), (0, 232, 255), 0.5 + 0.5 * math.sin(tsec * 1.4))
@@ -517,24 +732,22 @@ def main() -> int:
             draw_text(screen, font, "H: High Scores • Esc: Quit", (WIN_W // 2, center[1] + 70), (180, 190, 220), align="center")
 
         elif g.scene == Scene.PLAY:
-            draw_hud(screen, font_big, font, g.score, g.move_hz, g.paused, tsec)
+            draw_hud(screen, font_big, font, font_small, g.score, g.move_hz, g.paused, tsec)
 
             # Interpolate between last and current body for smoothness
-            alpha = clamp(g.move_accum, 0.0, 1.0)
-            if not g.last_body:
-                g.last_body = list(g.snake.body)
-            body_i = interpolate_body(g.last_body, g.snake.body, alpha)
+            alpha = clamp(g.move_accum_ms / g.move_interval_ms, 0.0, 1.0)
+            if len(g.last_body) == 0:
+                g.last_body = g.snake.body_arr
+            body_i = interpolate_body(g.last_body, g.snake.body_arr, alpha)
 
             draw_food(screen, g.food, tsec)
             draw_snake(screen, body_i, g.snake.dir, tsec)
 
         elif g.scene == Scene.GAME_OVER:
-            draw_hud(screen, font_big, font, g.score, g.move_hz, False, tsec)
+            draw_hud(screen, font_big, font, font_small, g.score, g.move_hz, False, tsec)
 
             # Dim overlay
-            overlay = pygame.Surface((WIN_W, WIN_H), pygame.SRCALPHA)
-            overlay.fill(add_alpha((8, 8, 14), 160))
-            screen.blit(overlay, (0, 0))
+            screen.blit(_dim_overlay_surface(), (0, 0))
 
             panel = pygame.Rect(WIN_W // 2 - 280, WIN_H // 2 - 140, 560, 280)
             draw_rounded_rect(screen, panel, add_alpha((14, 16, 34), 230), 22)
@@ -561,7 +774,7 @@ def main() -> int:
                 draw_text(screen, font, "R: Restart • H: High Scores • Esc: Quit", (panel.centerx, panel.bottom - 44), (170, 180, 210), align="center")
 
         elif g.scene == Scene.HIGHSCORES:
-            draw_hud(screen, font_big, font, g.score if g.score else 0, g.move_hz, False, tsec)
+            draw_hud(screen, font_big, font, font_small, g.score if g.score else 0, g.move_hz, False, tsec)
 
             panel = pygame.Rect(WIN_W // 2 - 320, WIN_H // 2 - 220, 640, 420)
             draw_rounded_rect(screen, panel, add_alpha((14, 16, 34), 220), 22)